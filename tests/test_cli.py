@@ -0,0 +1,20 @@
+import argparse
+import unittest
+
+from twig_sdc_yaml_generator import positive_int
+
+
+class PositiveIntTest(unittest.TestCase):
+    def test_accepts_positive_integers(self):
+        self.assertEqual(positive_int("1"), 1)
+        self.assertEqual(positive_int("16"), 16)
+
+    def test_rejects_other_values(self):
+        for value in ("0", "-1", "two", ""):
+            with self.subTest(value=value):
+                with self.assertRaises(argparse.ArgumentTypeError):
+                    positive_int(value)
+
+
+if __name__ == "__main__":
+    unittest.main()
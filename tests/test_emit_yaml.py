@@ -0,0 +1,104 @@
+import random
+import unittest
+from unittest import mock
+
+import yaml
+
+import twig_sdc_yaml_generator
+from twig_sdc_yaml_generator import dump_yaml, emit_yaml
+
+WORDS = [
+    "word", "Yes", "no", "true", "null", "On", "a:", ":", "#x", "x#", "it's",
+    "50%", "-a", "Label:", "y", "N", "~", "1.5", "0x1f", "2024-01-01", "x",
+    "é", "’", "veryveryveryveryveryveryveryvery", "longerword" * 3,
+]
+KEYS = [
+    "type", "title", "description", "enum", "properties", "items", "default",
+    "x" * 122, "x" * 123, "x" * 128, "x" * 129, "404", "true", "a b", "a: b",
+]
+CHARACTERS = "abcXYZ019 _-.:#'\"!?,()[]{}%@&*|>`~\\/é\t\n"
+
+
+class PureComponentDumper(yaml.SafeDumper):
+    def ignore_aliases(self, data):
+        return True
+
+
+def random_text(rng):
+    kind = rng.random()
+    if kind < 0.5:
+        return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 30)))
+    if kind < 0.6:
+        return "".join(rng.choice(CHARACTERS) for _ in range(rng.randint(0, 100)))
+    if kind < 0.7:
+        return (
+            rng.choice(["", "  "])
+            + " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 5)))
+            + rng.choice(["", " ", ":"])
+        )
+    return " ".join(
+        [rng.choice(WORDS).capitalize()]
+        + [rng.choice(WORDS) for _ in range(rng.randint(0, 40))]
+    )
+
+
+def random_value(rng, depth=0):
+    kind = rng.random()
+    if depth < 5 and kind < 0.3:
+        return {
+            random_key(rng): random_value(rng, depth + 1)
+            for _ in range(rng.randint(0, 4))
+        }
+    if kind < 0.4:
+        return [
+            rng.choice([1, True, None, {"a": 1}, 1.5])
+            if rng.random() < 0.2
+            else random_text(rng)
+            for _ in range(rng.randint(0, 4))
+        ]
+    if kind < 0.5:
+        return rng.choice([None, True, False, 0, -3, 10**20, 1.5, float("inf")])
+    return random_text(rng)
+
+
+def random_key(rng):
+    return rng.choice(KEYS) if rng.random() < 0.8 else random_text(rng)
+
+
+class EmitYamlTest(unittest.TestCase):
+    """emit_yaml() must write exactly what dump_yaml() writes."""
+
+    def assert_same_as_dump(self, data):
+        self.assertEqual(emit_yaml(data), dump_yaml(data), data)
+
+    def check_dumper(self, dumper):
+        with mock.patch.object(twig_sdc_yaml_generator, "ComponentDumper", dumper):
+            for data in (
+                {"name": "Button", "status": "experimental", "group": "Atoms"},
+                {"name": "404"},
+                {"name": "True"},
+                {"description": "Size: small, large"},
+                {"description": "The label" + " text" * 30},
+                {"description": "It's: " + "quoted " * 20 + "#tag"},
+                {"description": "Non-ASCII ’ text" * 10},
+                {"properties": {}, "enum": [], "default": None},
+                {"x" * 122: {"y" * 122: "z"}},
+                {"x" * 123: "z"},
+            ):
+                with self.subTest(data=data):
+                    self.assert_same_as_dump(data)
+
+            rng = random.Random(0)
+            for _ in range(2000):
+                data = {random_key(rng): random_value(rng) for _ in range(4)}
+                self.assert_same_as_dump(data)
+
+    def test_default_dumper(self):
+        self.check_dumper(twig_sdc_yaml_generator.ComponentDumper)
+
+    def test_pure_python_dumper(self):
+        self.check_dumper(PureComponentDumper)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import io
+import unittest
+
+from twig_sdc_yaml_generator import generate_yaml
+
+VARIABLES = {
+    "label": {"type": "string", "title": "Label", "description": "The label."},
+    "size": {
+        "type": "string",
+        "title": "Size",
+        "description": "The size, optional.",
+        "enum": ["small", "large"],
+    },
+}
+SLOTS = {"content": {"title": "Content", "description": "The content."}}
+
+
+class GenerateYamlTest(unittest.TestCase):
+    def test_stream_gets_the_returned_yaml(self):
+        for slots in ({}, SLOTS):
+            with self.subTest(slots=slots):
+                arguments = ("button", VARIABLES, slots, False, set(), "Atoms")
+                stream = io.StringIO()
+                self.assertIsNone(generate_yaml(*arguments, stream=stream))
+                self.assertEqual(stream.getvalue(), generate_yaml(*arguments))
+
+    def test_writes_after_existing_stream_content(self):
+        stream = io.StringIO()
+        stream.write("# Generated\n")
+        generate_yaml("button", VARIABLES, SLOTS, False, set(), "Atoms", stream=stream)
+        self.assertEqual(
+            stream.getvalue(),
+            "# Generated\n"
+            + generate_yaml("button", VARIABLES, SLOTS, False, set(), "Atoms"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
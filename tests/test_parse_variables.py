@@ -0,0 +1,50 @@
+import unittest
+
+from twig_sdc_yaml_generator import parse_variables
+
+
+def parse(twig_content):
+    return parse_variables(twig_content, "component", ".", {})
+
+
+class ScopeTest(unittest.TestCase):
+    def test_object_and_array_scopes_of_the_same_name(self):
+        variables, _, _ = parse(
+            "{#\n"
+            " * - item: [object] First declaration.\n"
+            " *   - label: [string] The label.\n"
+            " * - item: [array] Second declaration.\n"
+            " *   - url: [string] The url.\n"
+            "#}\n"
+        )
+        self.assertEqual(
+            variables["item"]["items"],
+            {
+                "type": "object",
+                "properties": {
+                    "url": {"type": "string", "title": "Url", "description": "The url."}
+                },
+            },
+        )
+
+
+class TokenTest(unittest.TestCase):
+    def test_default_filter_inside_set_tag(self):
+        variables, _, _ = parse(
+            "{#\n"
+            " * - variant: [string] The variant.\n"
+            " * - modifier: [string] The modifier.\n"
+            "#}\n"
+            "{% set cls = modifier ? modifier : variant|default('primary') %}\n"
+        )
+        self.assertEqual(variables["variant"]["default"], "primary")
+
+    def test_tokens_inside_description(self):
+        _, _, conditional_variables = parse(
+            " * - label: [string] Shown when {% if icon %} is set, see text ?? null.\n"
+        )
+        self.assertEqual(conditional_variables, {"icon", "text"})
+
+
+if __name__ == "__main__":
+    unittest.main()
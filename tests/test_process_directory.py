@@ -0,0 +1,140 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import twig_sdc_yaml_generator
+from twig_sdc_yaml_generator import (
+    cache_version,
+    index_include_files,
+    load_cache,
+    process_directory,
+)
+
+COMPONENT = """{#
+ * - label: [string] The label.
+#}
+"""
+
+INCLUDING_COMPONENT = """{#
+ * - items: [array] The items.
+#}
+{% for item in items %}
+  {% include '@theme/atoms/item.stories.twig' with { label: item } only %}
+{% endfor %}
+"""
+
+
+class CacheTest(unittest.TestCase):
+    def setUp(self):
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.directory = temporary_directory.name
+        self.component_directory = os.path.join(self.directory, "x")
+        os.mkdir(self.component_directory)
+        self.cache_path = os.path.join(self.directory, "cache.json")
+
+    def write_twig(self, name, content=COMPONENT):
+        with open(os.path.join(self.component_directory, name), "w") as twig_file:
+            twig_file.write(content)
+
+    def run_generator(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            process_directory(
+                self.directory,
+                index_include_files(self.directory),
+                jobs=1,
+                cache_path=self.cache_path,
+            )
+        return output.getvalue()
+
+    def read_readme(self):
+        with open(os.path.join(self.component_directory, "README.md")) as readme:
+            return readme.read()
+
+    def test_readme_of_skipped_last_component(self):
+        self.write_twig("alpha.twig")
+        self.write_twig("beta.twig")
+        self.run_generator()
+        readme = self.read_readme()
+
+        # Make alpha.twig differ from its cache entry
+        self.write_twig("alpha.twig", COMPONENT + "\n")
+        output = self.run_generator()
+
+        self.assertIn("Processed", output)
+        self.assertIn("Skipped", output)
+        self.assertEqual(self.read_readme(), readme)
+
+    def test_include_removed_after_parsing(self):
+        self.write_twig("item.stories.twig")
+        self.write_twig("gallery.twig", INCLUDING_COMPONENT)
+        file_fingerprint = twig_sdc_yaml_generator.file_fingerprint
+
+        def fingerprint_without_include(file_path):
+            if file_path.endswith("item.stories.twig"):
+                return None
+            return file_fingerprint(file_path)
+
+        with mock.patch(
+            "twig_sdc_yaml_generator.file_fingerprint", fingerprint_without_include
+        ):
+            self.run_generator()
+
+        # The component depending on the removed include is not cached
+        self.assertIn("Processed x/gallery.twig", self.run_generator())
+
+
+class LoadCacheTest(unittest.TestCase):
+    def test_unusable_cache_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache_path = os.path.join(directory, "cache.json")
+            for content in (
+                "{",
+                "[]",
+                json.dumps({"version": None, "files": {"a.twig": []}}),
+                json.dumps({"version": cache_version, "files": []}),
+                json.dumps({"version": cache_version}),
+            ):
+                with self.subTest(content=content):
+                    with open(cache_path, "w") as cache_file:
+                        cache_file.write(content)
+                    self.assertEqual(load_cache(cache_path), {})
+
+            self.assertEqual(load_cache(os.path.join(directory, "missing.json")), {})
+            self.assertEqual(load_cache(directory), {})
+
+    def test_current_cache_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache_path = os.path.join(directory, "cache.json")
+            files = {"a.twig": {"twig": [1, 2, False], "includes": {}}}
+            with open(cache_path, "w") as cache_file:
+                json.dump({"version": cache_version, "files": files}, cache_file)
+            self.assertEqual(load_cache(cache_path), files)
+
+
+class IncludeCacheTest(unittest.TestCase):
+    def test_include_changed_between_runs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            component_directory = os.path.join(directory, "x")
+            os.mkdir(component_directory)
+            include_path = os.path.join(component_directory, "item.stories.twig")
+            with open(os.path.join(component_directory, "gallery.twig"), "w") as twig_file:
+                twig_file.write(INCLUDING_COMPONENT)
+
+            for label_type in ("string", "number"):
+                with open(include_path, "w") as include_file:
+                    include_file.write(COMPONENT.replace("[string]", f"[{label_type}]"))
+                with contextlib.redirect_stdout(io.StringIO()):
+                    process_directory(directory, index_include_files(directory), jobs=1)
+
+                with open(os.path.join(component_directory, "gallery.component.yml")) as yaml_file:
+                    self.assertIn(f"type: {label_type}", yaml_file.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
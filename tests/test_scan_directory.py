@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from twig_sdc_yaml_generator import scan_directory
+
+
+class ScanDirectoryTest(unittest.TestCase):
+    def test_skips_directories_that_cannot_be_listed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ("readable", "unreadable"):
+                os.mkdir(os.path.join(directory, name))
+                open(os.path.join(directory, name, name + ".twig"), "w").close()
+            unreadable = os.path.join(directory, "unreadable")
+
+            scandir = os.scandir
+
+            def failing_scandir(path):
+                if path == unreadable:
+                    raise PermissionError(path)
+                return scandir(path)
+
+            with mock.patch("os.scandir", failing_scandir):
+                walked = list(scan_directory(directory))
+
+        self.assertEqual(
+            walked,
+            [(directory, []), (os.path.join(directory, "readable"), ["readable.twig"])],
+        )
+
+    def test_missing_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            missing = os.path.join(directory, "missing")
+            self.assertEqual(list(scan_directory(missing)), [])
+
+    def test_links_to_directories_are_not_files_or_followed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            real = os.path.join(directory, "real")
+            os.mkdir(real)
+            open(os.path.join(real, "real.twig"), "w").close()
+            os.symlink(real, os.path.join(directory, "link.twig"))
+
+            walked = list(scan_directory(directory))
+
+        self.assertEqual(walked, [(directory, []), (real, ["real.twig"])])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,35 +1,226 @@
+import ast
 import re
 import yaml
 import os
+import sys
 import argparse
+import copy
+import io
+import json
+import itertools
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    # Prefer the libyaml-backed emitter when PyYAML was built with it. Its
+    # output parses to the same data, but it wraps long double-quoted scalars
+    # (e.g. descriptions with non-ASCII characters) without the "\" line
+    # continuation of the pure Python emitter, which can also shift the blank
+    # lines laid out around the props. See "Output Formatting" in README.md.
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
 
 # Define regex patterns for matching variables, object properties, default values, and conditionals
-variable_pattern = re.compile(r"\* - (\w+): \[(\w+|object|array)\] (.*)")
-object_property_pattern = re.compile(r"\*   - (\w+): \[(\w+)\] (.*)")
-default_pattern = re.compile(r"{% set (\w+) = [^%]+ \? [^:]+ : (.+?) %}")
-conditional_pattern = re.compile(r"{% if (\w+) %}")
-default_pipe_pattern = re.compile(r"(\w+)\|default\(\'(.+?)\'\)")
-null_coalescing_pattern = re.compile(r"\b(\w+)\s*\?\?\s*null\b")
-enum_pattern = re.compile(r'\* - (\w+): \[(string)\] .*?: ([^.,]+(?:, [^.,]+)*)')
+# Twig variable names are ASCII, so the patterns match \w, \s and \b in ASCII
+# mode, which spares the regex engine the Unicode character tables. Names with
+# non-ASCII letters are therefore not recognised; descriptions, matched with
+# "." and negated classes, may still hold any character.
+# The lookahead captures the comma separated enum values following the first
+# ": " of the description, if any, without consuming the description itself
+variable_pattern = re.compile(
+    r"\* - (\w+): \[(\w+|object|array)\] "
+    r"(?=(?:.*?: ([^.,\n]+(?:, [^.,\n]+)*))?)(.*)",
+    re.ASCII,
+)
+object_property_pattern = re.compile(r"\*   - (\w+): \[(\w+)\] (.*)", re.ASCII)
+default_pattern = re.compile(r"{% set (\w+) = [^%]+ \? [^:]+ : (.+?) %}", re.ASCII)
+conditional_pattern = re.compile(r"{% if (\w+) %}", re.ASCII)
+default_pipe_pattern = re.compile(r"(\w+)\|default\(\'(.+?)\'\)", re.ASCII)
+null_coalescing_pattern = re.compile(r"\b(\w+)\s*\?\?\s*null\b", re.ASCII)
+scope_pattern = re.compile(
+    r"\* - (\w+): \[(object|array)\](.*?)(?=\* - |\Z)", re.ASCII | re.DOTALL
+)
+include_pattern = re.compile(
+    r"{%\s*include\s*['\"]@[^/]+/[^/]+/([^'\"]+\.twig)['\"]\s*with\s*\{([^}]*)\}\s*only\s*%}",
+    re.ASCII,
+)
+with_variable_pattern = re.compile(r"(\w+):\s*(\w+|\'[^\']*\'|\"[^\"]*\")", re.ASCII)
+for_loop_pattern = re.compile(r"{%\s*for\s+(\w+)\s+in\s+(\w+)\s*%}", re.ASCII)
+
+# Default values that map to fixed Python values without being parsed.
+# Empty defaults map to the empty_default marker and are skipped.
+empty_default = object()
+default_literals = {"null": None, "false": False, "true": True, "": empty_default}
+
+# Variables that are never listed as required props
+never_required_variables = frozenset({"attributes", "modifier_class"})
+
+# Component groups keyed by the atomic design folder name
+component_groups = {
+    "00-base": "Base",
+    "01-atoms": "Atoms",
+    "02-molecules": "Molecules",
+    "03-organisms": "Organisms",
+    "04-templates": "Templates",
+}
+group_pattern = re.compile("|".join(map(re.escape, component_groups)))
+
+# First line of every component YAML file
+schema_line = "'$schema': 'https://git.drupalcode.org/project/drupal/-/raw/HEAD/core/assets/schemas/v1/metadata.schema.json'"
+
+# Words that YAML reads as booleans or null, in any letter case
+yaml_reserved_words = frozenset(
+    {"y", "n", "yes", "no", "on", "off", "true", "false", "null"}
+)
+
+# Printable ASCII words separated by single spaces. Starting with a letter,
+# such a string is emitted as a plain scalar unless it holds one of the ": "
+# and " #" indicators or ends with a colon, in which case it is single quoted.
+yaml_text_pattern = re.compile(r"[A-Za-z][!-~]*(?: [!-~]+)*\Z")
+yaml_indicator_pattern = re.compile(r": | #|:\Z")
+
+# Column after which the YAML emitter wraps long scalars
+yaml_line_width = 80
+
+# Length from which at least one of the emitters writes a key as a complex
+# "? key" entry. libyaml does so from 129 characters, the pure Python emitter
+# already from 123 as it counts the 5 characters of the implicit "!!str" tag.
+yaml_complex_key_length = 123
+
+# Turns dashed component names into words for titles
+dash_to_space = str.maketrans("-", " ")
+
+# README.md written next to every component
+readme_template = """
+# {title}
+
+This is the {label} component.
 
-def find_include_file(directory, var_name):
+## Usage
+
+This component can be used within Experience Builder and other page builders
+that support SDC. It can also be added to other components and theme templates.
+"""
+
+# Parsed include files keyed by path, see parse_include_file(). Include files
+# may change between runs, so every run starts with an empty cache.
+_include_cache = {}
+
+def index_include_files(directory):
     """
-    Find the include file with the same name as the variable in the specified directory.
+    Map every file name in the specified directory tree to its path.
 
-    Args:
-        directory (str): The path to the directory to search.
-        var_name (str): The name of the variable to search for.
+    The include directory is walked once, so looking up the include file of an
+    array variable does not walk the tree again.
 
+    Args:
+        directory (str): The path to the directory to index.
 
     Returns:
-        str: The path to the include file if found, None otherwise.
+        dict: The path of each file keyed by its name. When several files share
+              a name, the first one found is kept.
     """
-    for root, dirs, files in os.walk(directory):
+    include_index = {}
+    for root, files in scan_directory(directory):
         for file in files:
-            if file == f"{var_name}":
-                include_file_path = os.path.join(root, file)
-                return include_file_path
-    return None
+            include_index.setdefault(file, os.path.join(root, file))
+    return include_index
+
+
+def read_twig_file(file_path):
+    """
+    Read the content of a Twig file.
+
+    The raw bytes are read in one call and decoded as UTF-8 in one go, without
+    a text layer in between. Line endings are normalized to "\n" like text
+    mode does, so the patterns never see carriage returns.
+
+    Args:
+        file_path (str): The path to the Twig file.
+
+    Returns:
+        str: The content of the Twig file.
+    """
+    with open(file_path, "rb") as twig_file:
+        twig_content = twig_file.read().decode("utf-8")
+    if "\r" in twig_content:
+        twig_content = twig_content.replace("\r\n", "\n").replace("\r", "\n")
+    return twig_content
+
+
+def parse_include_file(
+    include_file_path, component_name, file_directory, include_index, dependencies=None
+):
+    """
+    Parse the variables of an include file, reusing earlier parses of the same file.
+
+    Shared include files are used by many components, so each one is read and
+    parsed only once per process. The parsed output does not depend on the
+    including component, hence the cache is keyed on the path alone.
+
+    Args:
+        include_file_path (str): The path to the include file.
+        component_name (str): The name of the including component.
+        file_directory (str): The directory where the including Twig file is located.
+        include_index (dict): The include file paths keyed by file name.
+        dependencies (dict): If given, the include files looked up while parsing
+                             the include file are added to it, see parse_variables().
+
+    Returns:
+        tuple: A deep copy of the variables dictionary, slots dictionary and
+               conditional variables set parsed from the include file.
+    """
+    if include_file_path not in _include_cache:
+        include_dependencies = {}
+        parsed = parse_variables(
+            read_twig_file(include_file_path),
+            component_name,
+            file_directory,
+            include_index,
+            include_dependencies,
+        )
+        _include_cache[include_file_path] = (parsed, include_dependencies)
+    parsed, include_dependencies = _include_cache[include_file_path]
+    if dependencies is not None:
+        dependencies.update(include_dependencies)
+    # Callers filter the parsed properties in place, so hand out a copy
+    return copy.deepcopy(parsed)
+
+
+def parse_with_variables(variables_content):
+    """
+    Parse the variables passed in the with clause of an include statement.
+
+    Args:
+        variables_content (str): The content inside the with clause.
+
+    Returns:
+        dict: The variable values keyed by variable name.
+    """
+    variables_dict = {}
+    for var_match in with_variable_pattern.finditer(variables_content):
+        var_name_extracted = var_match.group(1).strip()
+        var_value = var_match.group(2).strip()
+        variables_dict[var_name_extracted] = var_value
+    return variables_dict
+
+
+@functools.lru_cache(maxsize=1024)
+def word_boundary_pattern(name):
+    """
+    Return a compiled pattern matching the name as a whole word.
+
+    Variable names recur across components, so the compiled patterns are
+    cached for the whole run.
+
+    Args:
+        name (str): The name to match.
+
+    Returns:
+        re.Pattern: The compiled pattern.
+    """
+    return re.compile(r"\b{}\b".format(re.escape(name)), re.ASCII)
 
 
 def check_variable_in_includes(twig_content, target_var_name):
@@ -46,13 +237,7 @@ def check_variable_in_includes(twig_content, target_var_name):
         tuple: A tuple containing the Twig file name and a dictionary of variables found inside the include block.
                Returns (None, None) if the variable or its properties are not found.
     """
-    # Regex pattern to capture include statements and variable definitions
-    include_pattern = re.compile(
-        r"{%\s*include\s*['\"]@[^/]+/[^/]+/([^'\"]+\.twig)['\"]\s*with\s*\{([^}]*)\}\s*only\s*%}"
-    )
-
-    # Dictionary to hold variables found inside include block
-    include_variables_name = {}
+    target_var_pattern = word_boundary_pattern(target_var_name)
 
     # Check for direct variable usage
     for include_match in include_pattern.finditer(twig_content):
@@ -61,23 +246,16 @@ def check_variable_in_includes(twig_content, target_var_name):
             2
         )  # Extract the content inside the with clause
 
-        # Extract variables from the with content
-        variables_dict = {}
-        for var_match in re.finditer(
-            r"(\w+):\s*(\w+|\'[^\']*\'|\"[^\"]*\")", variables_content
+        # Search for the target variable name or its properties in the with content.
+        # The substring test is a cheap prefilter for the word-boundary regex.
+        if target_var_name in variables_content and target_var_pattern.search(
+            variables_content
         ):
-            var_name_extracted = var_match.group(1).strip()
-            var_value = var_match.group(2).strip()
-            variables_dict[var_name_extracted] = var_value
-
-        # Search for the target variable name or its properties in the with content
-        if re.search(r"\b{}\b".format(re.escape(target_var_name)), variables_content):
-            include_variables_name = variables_dict
-            return file_name, include_variables_name
+            return file_name, parse_with_variables(variables_content)
 
     # Check for indirect usage
     # Example: Detect variables used in loops
-    for loop_match in re.finditer(r"{%\s*for\s+(\w+)\s+in\s+(\w+)\s*%}", twig_content):
+    for loop_match in for_loop_pattern.finditer(twig_content):
         loop_var = loop_match.group(1)  # The loop variable (e.g., 'tag')
         loop_source = loop_match.group(2)  # The source variable (e.g., 'tags')
 
@@ -87,7 +265,8 @@ def check_variable_in_includes(twig_content, target_var_name):
             loop_content_end = twig_content.find("{% endfor %}", loop_content_start)
             loop_content = twig_content[loop_content_start:loop_content_end]
 
-            if re.search(r"\b{}\b".format(re.escape(loop_var)), loop_content):
+            loop_var_pattern = word_boundary_pattern(loop_var)
+            if loop_var in loop_content and loop_var_pattern.search(loop_content):
                 # If the loop variable is used in an include, consider indirect match
                 for include_match in include_pattern.finditer(loop_content):
                     file_name = include_match.group(1)  # Extract the Twig file name
@@ -95,20 +274,10 @@ def check_variable_in_includes(twig_content, target_var_name):
                         2
                     )  # Extract the content inside the with clause
 
-                    # Extract variables from the with content
-                    variables_dict = {}
-                    for var_match in re.finditer(
-                        r"(\w+):\s*(\w+|\'[^\']*\'|\"[^\"]*\")", variables_content
-                    ):
-                        var_name_extracted = var_match.group(1).strip()
-                        var_value = var_match.group(2).strip()
-                        variables_dict[var_name_extracted] = var_value
-
-                    if re.search(
-                        r"\b{}\b".format(re.escape(loop_var)), variables_content
+                    if loop_var in variables_content and loop_var_pattern.search(
+                        variables_content
                     ):
-                        include_variables_name = variables_dict
-                        return file_name, include_variables_name
+                        return file_name, parse_with_variables(variables_content)
     return None, None
 
 
@@ -132,58 +301,74 @@ def get_common_properties(include_variables_name, include_variables):
 
 
 def filter_properties(properties, all_variable_names_twig_filtered, var_name):
+    # Walk the nested properties with an explicit stack instead of recursing.
+    # Each level is filtered into a new dict to keep the key order, and the
+    # nested results are attached once the whole tree has been filtered.
     filtered_properties = {}
-    for key, value in properties.items():
-        if key not in all_variable_names_twig_filtered and key != var_name:
-            if "properties" in value and isinstance(value["properties"], dict):
-                nested_filtered = filter_properties(
-                    value["properties"], all_variable_names_twig_filtered, var_name
-                )
-                if nested_filtered:
-                    value["properties"] = nested_filtered
-                else:
-                    value.pop("properties", None)
-            filtered_properties[key] = value
-        elif key == var_name:
-            nested_type = get_last_child_type(value)
-            if nested_type:
-                filtered_properties["type"] = nested_type
-                filtered_properties["array_type"] = True
+    stack = [(properties, filtered_properties)]
+    nested_properties = []
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            if key not in all_variable_names_twig_filtered and key != var_name:
+                if "properties" in value and isinstance(value["properties"], dict):
+                    nested_filtered = {}
+                    stack.append((value["properties"], nested_filtered))
+                    nested_properties.append((value, nested_filtered))
+                target[key] = value
+            elif key == var_name:
+                nested_type = get_last_child_type(value)
+                if nested_type:
+                    target["type"] = nested_type
+                    target["array_type"] = True
+
+    for value, nested_filtered in nested_properties:
+        if nested_filtered:
+            value["properties"] = nested_filtered
+        else:
+            value.pop("properties", None)
     return filtered_properties
 
 
 def get_last_child_type(properties):
-    last_child_type = None
-    for key, value in properties.items():
-        if "properties" in value:
-            last_child_type = get_last_child_type(value["properties"])
-        elif "type" in value:
-            last_child_type = value["type"]
-    return last_child_type
+    # Only the last child carrying properties or a type decides the result,
+    # so scan from the end and descend into it without recursing.
+    while True:
+        for value in reversed(properties.values()):
+            if "properties" in value:
+                properties = value["properties"]
+                break
+            elif "type" in value:
+                return value["type"]
+        else:
+            return None
 
 def parse_default_value(default_value):
-    """Parse and return the default value as the appropriate Python type."""
+    """
+    Parse and return the default value as the appropriate Python type.
+
+    Returns empty_default for empty values, which callers skip.
+    """
     default_value = default_value.strip().replace("'", "").replace('"', "")
-    if default_value == "null":
-        return None
-    elif default_value == "false":
-        return False
-    elif default_value == "true":
-        return True
-    elif default_value == '':
-        return None  # Return None for empty strings to skip them
-    else:
-        try:
-            return eval(default_value)  # Safely evaluate literals
-        except (NameError, SyntaxError):
-            return default_value  # Return as string if it's not a literal
+    if default_value in default_literals:
+        return default_literals[default_value]
+    try:
+        # Only parses literals, Twig expressions are never executed
+        return ast.literal_eval(default_value)
+    except (ValueError, TypeError, SyntaxError):
+        return default_value  # Return as string if it's not a literal
+
+@functools.lru_cache(maxsize=4096)
+def title_from_name(name):
+    """Turn a snake_case variable name into a human readable title."""
+    return name.replace("_", " ").capitalize()
 
 def remove_trailing_period(s):
     if s.endswith('.'):
         return s[:-1]
     return s
 
-def parse_variables(twig_content, component_name, file_directory, include_directory):
+def parse_variables(twig_content, component_name, file_directory, include_index, dependencies=None):
     """
     Parse variables from Twig content, extract slots and conditional variables.
 
@@ -191,6 +376,10 @@ def parse_variables(twig_content, component_name, file_directory, include_direct
       twig_content (str): The content of the Twig file.
       component_name (str): The name of the component.
       file_directory (str): The directory where the Twig file is located.
+      include_index (dict): The include file paths keyed by file name.
+      dependencies (dict): If given, every include file name looked up while
+                           parsing, including those of nested includes, is
+                           added to it with the path it resolved to, or None.
 
     Returns:
       tuple: A tuple containing variables dictionary, slots dictionary, and conditional variables set.
@@ -199,21 +388,32 @@ def parse_variables(twig_content, component_name, file_directory, include_direct
     slots = {}
     conditional_variables = set()
 
-    all_variable_names_twig = []
+    # Collect the doc-comment body of every object/array variable in one scan,
+    # keeping the first one declared for each name and kind
+    scopes = {}
+    for match in scope_pattern.finditer(twig_content):
+        scopes.setdefault((match.group(1), match.group(2)), match.group(3))
 
-    all_variable_names_twig = []
-    for match in variable_pattern.finditer(twig_content):
-        var_name, var_type, var_desc = match.groups()
-        all_variable_names_twig.append(var_name)
+    # Each pattern scans the Twig content on its own, so the matches of
+    # different patterns may overlap, e.g. a |default() filter inside a
+    # {% set %} tag.
+    variable_matches = [
+        match.groups() for match in variable_pattern.finditer(twig_content)
+    ]
+    for pattern in (conditional_pattern, null_coalescing_pattern):
+        # Variables used in conditional statements
+        for match in pattern.finditer(twig_content):
+            conditional_variables.add(match.group(1))
 
-    # Find all variable matches in the Twig content
-    for match in variable_pattern.finditer(twig_content):
-        var_name, var_type, var_desc = match.groups()
+    all_variable_names_twig = frozenset(groups[0] for groups in variable_matches)
+
+    # Handle all variable matches in the Twig content
+    for var_name, var_type, enum_values, var_desc in variable_matches:
 
         # Detect and handle slots
         if "slot" in var_desc.lower():
             slots[var_name] = {
-                "title": var_name.replace("_", " ").capitalize(),
+                "title": title_from_name(var_name),
                 "description": var_desc,
             }
             continue
@@ -228,16 +428,13 @@ def parse_variables(twig_content, component_name, file_directory, include_direct
 
         # Create an entry for the variable
         variable_entry = {
-            "type": var_type if var_type != "object" else "object",
-            "title": var_name.replace("_", " ").capitalize(),
+            "type": var_type,
+            "title": title_from_name(var_name),
             "description": var_desc,
         }
 
-        # Add enum values if applicable
-        # Extract and add enum values if applicable
-        enum_match = enum_pattern.match(match.group(0))
-        if enum_match:
-            _, _, enum_values = enum_match.groups()
+        # Add enum values if applicable, only string variables declare them
+        if var_type == "string" and enum_values:
             enum_values = remove_trailing_period(enum_values)
             enums = [enum.strip() for enum in enum_values.split(',')]
 
@@ -251,12 +448,8 @@ def parse_variables(twig_content, component_name, file_directory, include_direct
         # Handle object properties
         if var_type == "object":
             variable_entry["properties"] = {}
-            object_scope_pattern = re.compile(
-                rf"\* - {var_name}: \[object\](.*?)(\* - |\Z)", re.DOTALL
-            )
-            object_scope_match = object_scope_pattern.search(twig_content)
-            if object_scope_match:
-                object_scope_content = object_scope_match.group(1)
+            object_scope_content = scopes.get((var_name, "object"))
+            if object_scope_content is not None:
                 for obj_match in object_property_pattern.finditer(object_scope_content):
                     obj_name, obj_type, obj_desc = obj_match.groups()
                     if obj_type == 'boolean':
@@ -267,7 +460,7 @@ def parse_variables(twig_content, component_name, file_directory, include_direct
                     else:
                         variable_entry["properties"][obj_name] = {
                             "type": obj_type,
-                            "title": obj_name.replace("_", " ").capitalize(),
+                            "title": title_from_name(obj_name),
                             "description": obj_desc,
                         }
 
@@ -277,45 +470,41 @@ def parse_variables(twig_content, component_name, file_directory, include_direct
             file_name, include_variables_name = check_variable_in_includes(
                 twig_content, var_name
             )
-            include_file_path = find_include_file(include_directory, file_name)
+            include_file_path = include_index.get(file_name)
+            if file_name and dependencies is not None:
+                dependencies[file_name] = include_file_path
             if include_file_path:
-                with open(include_file_path, "r") as include_file:
-                    include_content = include_file.read()
-                    include_variables, _, _ = parse_variables(
-                        include_content,
-                        component_name,
-                        file_directory,
-                        include_directory,
-                    )
-                    common_properties = get_common_properties(
-                        include_variables_name, include_variables
-                    )
-                    all_variable_names_twig_filtered = [
-                        item for item in all_variable_names_twig if item != var_name
-                    ]
-                    filtered_properties = filter_properties(
-                        common_properties, all_variable_names_twig_filtered, var_name
-                    )
-                    if (
-                        "array_type" in filtered_properties
-                        and filtered_properties["array_type"]
-                    ):
-                        filtered_properties.pop("array_type")
-                        variable_entry["items"] = filtered_properties
-                    else:
-                        variable_entry["items"] = {
-                            "type": "object",
-                            "properties": filtered_properties,
-                        }
+                include_variables, _, _ = parse_include_file(
+                    include_file_path,
+                    component_name,
+                    file_directory,
+                    include_index,
+                    dependencies,
+                )
+                common_properties = get_common_properties(
+                    include_variables_name, include_variables
+                )
+                # A set keeps the membership checks in filter_properties O(1)
+                all_variable_names_twig_filtered = all_variable_names_twig - {var_name}
+                filtered_properties = filter_properties(
+                    common_properties, all_variable_names_twig_filtered, var_name
+                )
+                if (
+                    "array_type" in filtered_properties
+                    and filtered_properties["array_type"]
+                ):
+                    filtered_properties.pop("array_type")
+                    variable_entry["items"] = filtered_properties
+                else:
+                    variable_entry["items"] = {
+                        "type": "object",
+                        "properties": filtered_properties,
+                    }
 
             else:
                 # Process array items inline
-                array_scope_pattern = re.compile(
-                    rf"\* - {var_name}: \[array\](.*?)(\* - |\Z)", re.DOTALL
-                )
-                array_scope_match = array_scope_pattern.search(twig_content)
-                if array_scope_match:
-                    array_scope_content = array_scope_match.group(1)
+                array_scope_content = scopes.get((var_name, "array"))
+                if array_scope_content is not None:
                     array_items = {}
 
                     for arr_match in object_property_pattern.finditer(
@@ -324,63 +513,37 @@ def parse_variables(twig_content, component_name, file_directory, include_direct
                         arr_name, arr_type, arr_desc = arr_match.groups()
                         array_items[arr_name] = {
                             "type": arr_type,
-                            "title": arr_name.replace("_", " ").capitalize(),
+                            "title": title_from_name(arr_name),
                             "description": arr_desc,
                         }
 
-                        if array_items:
-                            variable_entry["items"] = {
-                                "type": "object",
-                                "properties": array_items,
-                            }
-                        else:
-                            del variable_entry[
-                                "items"
-                            ]  # Remove items if no properties found
+                    # Only describe the items when properties were found
+                    if array_items:
+                        variable_entry["items"] = {
+                            "type": "object",
+                            "properties": array_items,
+                        }
 
         variables[var_name] = variable_entry
 
-    patterns = [default_pattern, default_pipe_pattern]
-
-    for pattern in patterns:
-        matches = pattern.findall(twig_content)
-        for variable_name, default_value in matches:
-            default_value = default_value.strip().replace("'", "").replace('"', "")
+    for pattern in (default_pattern, default_pipe_pattern):
+        for match in pattern.finditer(twig_content):
+            variable_name, default_value = match.groups()
             if variable_name in variables:
-                if default_value == "null":
-                    default_value = None
-                elif default_value == "false":
-                    default_value = False
-                elif default_value == "true":
-                    default_value = True
-                elif default_value == '':
+                default_value = parse_default_value(default_value)
+                if default_value is empty_default:
                     continue  # Skip empty strings
-                else:
-                    # Convert default_value to appropriate type if necessary
-                    try:
-                        default_value = eval(default_value)  # Safely evaluate literals
-                    except (NameError, SyntaxError):
-                        pass  # Keep it as a string if it's not a literal
 
                 variables[variable_name]["default"] = default_value
 
                 if 'enum' in variables[variable_name]:
                     enums = variables[variable_name].pop('enum')
                     variables[variable_name]['enum'] = enums
-    
-   
-
-    # Extract variables used in conditional statements
-    for match in conditional_pattern.finditer(twig_content):
-        conditional_variables.add(match.group(1))
-
-    for match in null_coalescing_pattern.finditer(twig_content):
-        conditional_variables.add(match.group(1))
 
     return variables, slots, conditional_variables
 
 
-def generate_yaml(component_name, variables, slots, has_js_file, conditional_variables, group):
+def generate_yaml(component_name, variables, slots, has_js_file, conditional_variables, group, stream=None):
     """
     Generate YAML data for the component based on parsed variables and slots.
 
@@ -390,161 +553,756 @@ def generate_yaml(component_name, variables, slots, has_js_file, conditional_var
       slots (dict): The slots dictionary.
       has_js_file (bool): Whether a JavaScript file exists for the component.
       conditional_variables (set): Set of conditional variables.
+      group (str): The group of the component.
+      stream (io.TextIOBase): The text stream to write the YAML to. If not
+                              given, the YAML is returned as a string.
 
     Returns:
-      str: The generated YAML as a string.
+      str: The generated YAML as a string, or None when written to a stream.
     """
     # Determine required fields based on descriptions, default values, and conditionals
-    required_fields = []
-    for key, var in variables.items():
-        if key in ["attributes", "modifier_class"]:
-            continue
-        if (
-            "optional" not in var.get("description", "")
-            and var.get("type") != "boolean"
-        ):
-            if "default" not in var and key not in conditional_variables:
-                required_fields.append(key)
-
-    yaml_data = {
-        "name": component_name.replace('-', ' ').capitalize(),
-        "status": "experimental",
-        "group": group,
-        "props": {"type": "object"},
-    }
+    required_fields = [
+        key
+        for key, var in variables.items()
+        if key not in never_required_variables
+        and "optional" not in var.get("description", "")
+        and var.get("type") != "boolean"
+        and "default" not in var
+        and key not in conditional_variables
+    ]
+
+    props_data = {"type": "object"}
 
     # Add required fields inside props before properties if not empty
     if required_fields:
-        yaml_data["props"]["required"] = required_fields
+        props_data["required"] = required_fields
 
     # Include properties
-    yaml_data["props"]["properties"] = variables  # Include all variables
+    props_data["properties"] = variables  # Include all variables
+
+    output = io.StringIO() if stream is None else stream
+    with YamlLayoutWriter(output) as writer:
+        emit_yaml(
+            {
+                "name": component_name.translate(dash_to_space).capitalize(),
+                "status": "experimental",
+                "group": group,
+                "props": props_data,
+            },
+            writer,
+        )
+
+        # Add slots if not empty
+        if slots:
+            emit_yaml({"slots": slots}, writer)
+
+    if stream is None:
+        return output.getvalue()
+
+
+class ComponentDumper(SafeDumper):
+    """
+    YAML dumper that never writes anchors and aliases.
+
+    Component data is a tree without shared nodes, so the representer does not
+    need to track every dict and list it has seen to detect repeated ones.
+    Dumping the same object twice also writes it out twice, like emit_yaml()
+    does.
+    """
+
+    def ignore_aliases(self, data):
+        return True
+
+
+def dump_yaml(data, stream=None, width=yaml_line_width):
+    """
+    Dump data as block style YAML.
+
+    Args:
+      data (dict): The data to dump.
+      stream (io.TextIOBase): The text stream to write the YAML to. If not
+                              given, the YAML is returned as a string.
+      width (int): The column after which long scalars are wrapped.
+
+    Returns:
+      str: The dumped YAML, or None when written to a stream.
+    """
+    return yaml.dump(
+        data,
+        stream,
+        Dumper=ComponentDumper,
+        sort_keys=False,
+        default_flow_style=False,
+        indent=2,
+        width=width,
+    )
+
+
+def emit_yaml(data, stream=None):
+    """
+    Dump data as block style YAML, writing the common cases directly.
+
+    The output is the same as dump_yaml() gives. Nested mappings, lists and
+    scalars whose layout is known are written without the YAML emitter. Any
+    other entry is dumped on its own by dump_yaml(), with the line width
+    narrowed by its indent so long scalars wrap at the same columns.
+
+    Args:
+      data (dict): The data to dump.
+      stream (io.TextIOBase): The text stream to write the YAML to. If not
+                              given, the YAML is returned as a string.
+
+    Returns:
+      str: The dumped YAML, or None when written to a stream.
+    """
+    lines = []
+    emit_yaml_mapping(data, 0, lines)
+    if stream is None:
+        return "".join(lines)
+    stream.write("".join(lines))
+
+
+def emit_yaml_mapping(mapping, indent, lines):
+    """Append the entries of a block mapping at the given indent to lines."""
+    prefix = " " * indent
+    for key, value in mapping.items():
+        if not emit_yaml_entry(key, value, indent, prefix, lines):
+            entry = dump_yaml({key: value}, width=yaml_line_width - indent)
+            lines.extend(
+                prefix + line if line != "\n" else line
+                for line in entry.splitlines(keepends=True)
+            )
+
+
+def emit_yaml_entry(key, value, indent, prefix, lines):
+    """
+    Append a block mapping entry to lines if its layout is known.
+
+    Args:
+      key (str): The mapping key.
+      value: The mapping value.
+      indent (int): The indent of the key.
+      prefix (str): The indent of the key as spaces.
+      lines (list): The lines written so far.
+
+    Returns:
+      bool: Whether the entry was appended.
+    """
+    if (
+        not isinstance(key, str)
+        or len(key) >= yaml_complex_key_length
+        or yaml_scalar_text(key, 0, 0) != key
+    ):
+        return False
+
+    if isinstance(value, dict):
+        if not value:
+            lines.append(f"{prefix}{key}: {{}}\n")
+        else:
+            lines.append(f"{prefix}{key}:\n")
+            emit_yaml_mapping(value, indent + 2, lines)
+        return True
+
+    if isinstance(value, list):
+        if not value:
+            lines.append(f"{prefix}{key}: []\n")
+            return True
+        # Lists in a mapping are not indented, the items wrap like values do
+        items = []
+        for item in value:
+            text = yaml_scalar_text(item, indent + 2, indent + 2)
+            if text is None:
+                return False
+            items.append(f"{prefix}- {text}\n")
+        lines.append(f"{prefix}{key}:\n")
+        lines.extend(items)
+        return True
+
+    text = yaml_scalar_text(value, indent + len(key) + 2, indent + 2)
+    if text is None:
+        return False
+    lines.append(f"{prefix}{key}: {text}\n")
+    return True
+
+
+def yaml_scalar_text(value, column, indent):
+    """
+    Return a scalar the way the YAML emitter writes it.
+
+    Long strings are wrapped at the first space after the line width, with
+    the continuation lines indented.
+
+    Args:
+      value: The scalar value.
+      column (int): The column the scalar starts at.
+      indent (int): The indent of continuation lines.
+
+    Returns:
+      str: The scalar text, or None if its layout is not known.
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if (
+        not isinstance(value, str)
+        or not yaml_text_pattern.match(value)
+        or value.lower() in yaml_reserved_words
+    ):
+        return None
 
-    # Add slots if not empty
-    if slots:
-        yaml_data["slots"] = slots
+    words = value.split(" ")
+    quote = ""
+    if yaml_indicator_pattern.search(value):
+        quote = "'"
+        column += 1
+        words = [word.replace("'", "''") for word in words]
+
+    parts = [quote, words[0]]
+    column += len(words[0])
+    for word in words[1:]:
+        if column > yaml_line_width:
+            parts.append("\n" + " " * indent)
+            column = indent
+        else:
+            parts.append(" ")
+            column += 1
+        parts.append(word)
+        column += len(word)
+    parts.append(quote)
+    return "".join(parts)
+
+
+class YamlLayoutWriter(io.TextIOBase):
+    """
+    Text stream that lays out component YAML while it is being written.
 
-     # Dump YAML data
-    yaml_output =  yaml.dump(yaml_data, sort_keys=False, default_flow_style=False, indent=2)
-    return format_yaml(yaml_output)
+    The schema reference is written first. Every complete line is then
+    formatted as soon as it arrives: list items are indented, and blank lines
+    separate the top-level keys and the property groups. Blank lines are held
+    back until a following line is written, so the document never ends with
+    one. Closing the writer flushes it without closing the wrapped stream.
+    """
 
-def format_yaml(yaml_str):
-    lines = yaml_str.splitlines()
-    result = ["'$schema': 'https://git.drupalcode.org/project/drupal/-/raw/HEAD/core/assets/schemas/v1/metadata.schema.json'", ""]
-    properties_depth = 0
-    previous_indent = 0
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+        self.partial_line = ""
+        self.pending_blank_lines = 0
+        self.properties_depth = 0
+        self.previous_indent = 0
+        self.write_line(schema_line)
+        self.write_blank_line()
+
+    def writable(self):
+        return True
 
-    for i, line in enumerate(lines):
-        stripped_line = line.strip()
+    def write(self, text):
+        lines = (self.partial_line + text).split("\n")
+        self.partial_line = lines.pop()
+        for line in lines:
+            self.format_line(line)
+        return len(text)
+
+    def close(self):
+        if not self.closed and self.partial_line:
+            self.format_line(self.partial_line)
+            self.partial_line = ""
+        super().close()
+
+    def write_line(self, line):
+        if not line:
+            self.write_blank_line()
+            return
+        if self.pending_blank_lines:
+            self.stream.write("\n" * self.pending_blank_lines)
+            self.pending_blank_lines = 0
+        self.stream.write(line + "\n")
+
+    def write_blank_line(self):
+        self.pending_blank_lines += 1
+
+    def format_line(self, line):
+        # The emitter never writes trailing whitespace, so stripping the
+        # indent alone is enough and stops at the first non-space character
+        stripped_line = line.lstrip(" ")
         current_indent = len(line) - len(stripped_line)
         # Add blank lines before properties at any level
         if stripped_line == "properties:":
-            # if properties_depth > 0:
-            result.append("")  # Add a blank line before nested properties
-            result.append(line)
-            properties_depth += 1
-            previous_indent = current_indent
-            continue
-        
+            self.write_blank_line()  # Add a blank line before nested properties
+            self.write_line(line)
+            self.properties_depth += 1
+            self.previous_indent = current_indent
+            return
+
         # Add a blank line if properties is an empty object
         if stripped_line == "properties: {}":
-            result.append(line)
-            result.append("")  # Add a blank line after the empty properties object
-            continue
-        
+            self.write_line(line)
+            self.write_blank_line()  # Add a blank line after the empty properties object
+            return
+
         # Handle array values
         if stripped_line.startswith('-'):
             # Indent the array item by two spaces
-            result.append("  " + line)
-            continue
+            self.write_line("  " + line)
+            return
 
         # Handle nested properties
-        if stripped_line and stripped_line != "properties:" and properties_depth > 0:
-            if   previous_indent > current_indent:
-                result.append("")  # Add a blank line before nested properties
-            previous_indent = current_indent
-        result.append(line)
+        if stripped_line and self.properties_depth > 0:
+            if self.previous_indent > current_indent:
+                self.write_blank_line()  # Add a blank line before nested properties
+            self.previous_indent = current_indent
+        self.write_line(line)
 
         # Check if exiting a properties section
-        if current_indent < previous_indent:
-            while properties_depth > 0 and current_indent <= previous_indent:
-                properties_depth -= 1
-                if properties_depth > 0:
-                    result.append("")  # Add a blank line before the next sibling properties
-                previous_indent = current_indent
-        
+        if current_indent < self.previous_indent:
+            while self.properties_depth > 0 and current_indent <= self.previous_indent:
+                self.properties_depth -= 1
+                if self.properties_depth > 0:
+                    self.write_blank_line()  # Add a blank line before the next sibling properties
+                self.previous_indent = current_indent
+
         if current_indent == 0:
-            result.append("")
+            self.write_blank_line()
 
-    return "\n".join(result).rstrip() + "\n"
 
-def process_directory(directory, include_directory):
+def scan_directory(directory):
     """
-    Process all Twig files in a directory, generate YAML configurations for each component.
+    Walk a directory tree top-down, listing each directory once with os.scandir.
+
+    Directories that cannot be listed, e.g. for lack of permission or because
+    they were removed during the walk, are skipped together with their
+    subdirectories. Links to directories are not followed.
 
     Args:
-      directory (str): The path to the directory containing Twig files.
+      directory (str): The path to the directory to walk.
+
+    Yields:
+      tuple: The directory path and the names of the files in it.
     """
-    for root, dirs, files in os.walk(directory):
+    stack = [directory]
+    while stack:
+        root = stack.pop()
+        subdirectories = []
+        files = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    # Like os.walk, links to directories are listed as
+                    # directories but not descended into
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(entry.name)
+                    elif not entry.is_symlink():
+                        subdirectories.append(entry.path)
+        except OSError:
+            # Skip directories that cannot be listed, like os.walk does
+            continue
+
+        yield root, files
+
+        # Visit subdirectories in listing order, like os.walk does
+        stack.extend(reversed(subdirectories))
+
+
+def iter_twig_files(directory):
+    """
+    Walk a directory tree and yield the component Twig files found in it.
+
+    The presence of the component's JavaScript file is checked against the
+    directory listing instead of with a separate stat call.
+
+    Args:
+      directory (str): The path to the directory to walk.
+
+    Yields:
+      tuple: The directory path, the Twig file name and whether a JavaScript
+             file exists for the component.
+    """
+    for root, files in scan_directory(directory):
+        names = set(files)
         for file in files:
-              if file.endswith('.twig') and not file.endswith('.stories.twig'):
-                component_name = file.split(".")[0]
-                file_path = os.path.join(root, file)
-                # Check for the existence of a JS file
-                js_file_path = os.path.join(root, f"{component_name.lower()}.js")
-                has_js_file = os.path.exists(js_file_path)
-
-                # Read and parse the Twig file content
-                with open(file_path, "r") as twig_file:
-                    twig_content = twig_file.read()
-                    variables, slots, conditional_variables = parse_variables(
-                        twig_content, component_name, root, include_directory
-                    )
+            if file.endswith('.twig') and not file.endswith('.stories.twig'):
+                component_name = file.partition(".")[0]
+                yield root, file, component_name.lower() + ".js" in names
 
-                group = 'default'
-                
-                if '00-base' in file_path:
-                    group = 'Base'
-                elif '01-atoms' in file_path:
-                    group = 'Atoms'
-                elif '02-molecules' in file_path:
-                    group = 'Molecules'
-                elif '03-organisms' in file_path:
-                    group = 'Organisms'
-                elif '04-templates' in file_path:
-                    group = 'Templates'
-
-                # Generate YAML content and write to .component.yml file
-                yaml_output = generate_yaml(
-                    component_name, variables, slots, has_js_file, conditional_variables, group
-                )
+
+def write_if_changed(file_path, content):
+    """
+    Write content to a file unless the file already holds exactly that content.
+
+    Skipping identical rewrites keeps file modification times stable, so
+    regenerating an unchanged component tree does not touch the disk. The
+    content is written to a temporary file next to the target, which then
+    replaces it, so an interrupted run never leaves a truncated file behind.
+
+    The content is encoded as UTF-8 once and both the comparison and the
+    write work on those bytes, bypassing the text layer.
+
+    Args:
+      file_path (str): The path to the file to write.
+      content (str): The content to write.
+
+    Returns:
+      bool: Whether the file was written.
+    """
+    data = content.encode("utf-8")
+    try:
+        with open(file_path, "rb") as existing_file:
+            # A size mismatch settles it without reading the file
+            if (
+                os.fstat(existing_file.fileno()).st_size == len(data)
+                and existing_file.read() == data
+            ):
+                return False
+    except FileNotFoundError:
+        pass
+
+    temp_file_path = file_path + ".tmp"
+    try:
+        with open(temp_file_path, "wb") as output_file:
+            output_file.write(data)
+        os.replace(temp_file_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
+        raise
+    return True
+
+
+def process_twig_file(directory, root, file, has_js_file, include_index, dependencies=None):
+    """
+    Generate the YAML configuration and README for a single component.
+
+    Args:
+      directory (str): The path to the directory being processed.
+      root (str): The directory where the Twig file is located.
+      file (str): The name of the Twig file.
+      has_js_file (bool): Whether a JavaScript file exists for the component.
+      include_index (dict): The include file paths keyed by file name.
+      dependencies (dict): If given, the include files the component depends
+                           on are added to it, see parse_variables().
+
+    Returns:
+      str: A message reporting the processed file and its output.
+    """
+    component_name = file.partition(".")[0]
+    file_path = os.path.join(root, file)
+
+    # Read and parse the Twig file content
+    twig_content = read_twig_file(file_path)
+    variables, slots, conditional_variables = parse_variables(
+        twig_content, component_name, root, include_index, dependencies
+    )
+
+    # Derive the component group from the atomic design folder it lives in
+    group_match = group_pattern.search(file_path)
+    group = component_groups[group_match.group(0)] if group_match else 'default'
+
+    # Generate YAML content and write to .component.yml file
+    yaml_output = generate_yaml(
+        component_name, variables, slots, has_js_file, conditional_variables, group
+    )
+    yaml_file_path = os.path.join(root, component_name.lower() + ".component.yml")
+    write_if_changed(yaml_file_path, yaml_output)
+
+    write_readme(root, component_name)
+    # Report relative path of processed files
+    relative_file_path = os.path.relpath(file_path, directory)
+    relative_yaml_path = os.path.relpath(yaml_file_path, directory)
+    return f"Processed {relative_file_path}, output saved to {relative_yaml_path}"
+
+
+def write_readme(root, component_name):
+    """
+    Write the README.md of a component directory.
+
+    Args:
+      root (str): The directory where the component is located.
+      component_name (str): The name of the component.
+    """
+    component_label = component_name.translate(dash_to_space)
+    readme_content = readme_template.format(
+        title=component_label.capitalize(), label=component_label
+    )
+    write_if_changed(os.path.join(root, "README.md"), readme_content)
+
+
+# Include index of a worker process, set once by _init_worker()
+_worker_include_index = None
+
+
+def _init_worker(include_index):
+    global _worker_include_index
+    _worker_include_index = include_index
+    _include_cache.clear()
+
+
+def process_twig_files(directory, root, twig_files, include_index):
+    """
+    Process the component Twig files of one directory.
+
+    Args:
+      directory (str): The path to the directory being processed.
+      root (str): The directory where the Twig files are located.
+      twig_files (list): The Twig file names and whether a JavaScript file
+                         exists for each component.
+      include_index (dict): The include file paths keyed by file name.
+
+    Returns:
+      list: The path of each Twig file, the message reporting it and the
+            include files it depends on.
+    """
+    results = []
+    for file, has_js_file in twig_files:
+        dependencies = {}
+        message = process_twig_file(
+            directory, root, file, has_js_file, include_index, dependencies
+        )
+        results.append((os.path.join(root, file), message, dependencies))
+    return results
+
+
+def _process_twig_files(directory, root, twig_files):
+    """Process the component Twig files of one directory in a worker process."""
+    return process_twig_files(directory, root, twig_files, _worker_include_index)
+
+
+def file_fingerprint(file_path):
+    """Return the modification time and size of a file, or None if it is missing."""
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+# Invalidates the cache of earlier runs whenever this script, the PyYAML
+# version or the emitter changes, as each of them can change the output
+cache_version = [
+    file_fingerprint(os.path.abspath(__file__)),
+    yaml.__version__,
+    SafeDumper.__name__,
+]
+
+
+def load_cache(cache_path):
+    """
+    Load the cache written by an earlier run, see process_directory().
+
+    Args:
+      cache_path (str): The path to the cache file.
+
+    Returns:
+      dict: The cache entries keyed by Twig file path. Empty when the cache
+            file is missing, unreadable or written by another version.
+    """
+    try:
+        with open(cache_path, "r") as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != cache_version:
+        return {}
+    files = cache.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def is_cache_entry_current(entry, fingerprint, include_index):
+    """
+    Check whether a component is unchanged since its cache entry was written.
+
+    Args:
+      entry (dict): The cache entry of the component.
+      fingerprint (list): The current fingerprint of the Twig file.
+      include_index (dict): The include file paths keyed by file name.
+
+    Returns:
+      bool: Whether the Twig file and every include file it depends on are unchanged.
+    """
+    if entry.get("twig") != fingerprint:
+        return False
+    for file_name, include in entry.get("includes", {}).items():
+        include_file_path = include_index.get(file_name)
+        if include is None:
+            if include_file_path is not None:
+                return False
+        elif (
+            include_file_path != include[0]
+            or file_fingerprint(include_file_path) != include[1:]
+        ):
+            return False
+    return True
+
+
+def process_directory(directory, include_index, jobs=None, cache_path=None):
+    """
+    Process all Twig files in a directory, generate YAML configurations for each component.
+
+    Components are processed in parallel by a pool of worker processes. With a
+    cache file, components whose Twig file, JavaScript file presence and include
+    files are unchanged since the run that wrote the cache are skipped.
+
+    Args:
+      directory (str): The path to the directory containing Twig files.
+      include_index (dict): The include file paths keyed by file name.
+      jobs (int): The number of worker processes, defaults to the number of
+                  CPUs. With 1 the files are processed in this process.
+      cache_path (str): The path to the cache file, none is used by default.
+    """
+    _include_cache.clear()
+    cache = load_cache(cache_path) if cache_path else {}
+    new_cache = {}
+    fingerprints = {}
+    skipped_messages = []
+    # The README.md of a directory describes the last component in it
+    last_components = {}
+
+    # Components in the same directory share its README.md, so the Twig files
+    # are grouped by directory and each group is processed in order.
+    tasks = {}
+    for root, file, has_js_file in iter_twig_files(directory):
+        last_components[root] = file
+        if cache_path:
+            file_path = os.path.join(root, file)
+            twig_fingerprint = file_fingerprint(file_path)
+            # A Twig file removed since the walk is processed, and fails, as
+            # without a cache
+            if twig_fingerprint is not None:
+                fingerprint = twig_fingerprint + [has_js_file]
+                entry = cache.get(file_path)
                 yaml_file_path = os.path.join(
-                    root, f"{component_name.lower()}.component.yml"
+                    root, file.partition(".")[0].lower() + ".component.yml"
                 )
-                with open(yaml_file_path, "w") as yaml_file:
-                    yaml_file.write(yaml_output)
-                    
-                # Create a string with the desired content
-                readme_content = f"""
-# {component_name.replace('-', ' ').capitalize()}
+                if (
+                    entry is not None
+                    and is_cache_entry_current(entry, fingerprint, include_index)
+                    and os.path.exists(yaml_file_path)
+                ):
+                    new_cache[file_path] = entry
+                    skipped_messages.append(
+                        f"Skipped {os.path.relpath(file_path, directory)}, unchanged"
+                    )
+                    continue
+                fingerprints[file_path] = fingerprint
+        tasks.setdefault(root, []).append((file, has_js_file))
+
+    write_messages(skipped_messages)
+
+    if jobs == 1 or len(tasks) <= 1:
+        results = (
+            result
+            for root, twig_files in tasks.items()
+            for result in process_twig_files(directory, root, twig_files, include_index)
+        )
+        write_messages(cache_results(results, fingerprints, new_cache))
+    else:
+        # Start no more workers than there are directories to process. Hand
+        # out up to 8 directories per round trip to amortize the IPC, while
+        # keeping at least a few chunks per worker so they stay evenly loaded
+        workers = min(jobs or os.cpu_count() or 1, len(tasks))
+        chunksize = max(1, min(8, len(tasks) // (workers * 4)))
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(include_index,)
+        ) as executor:
+            results = executor.map(
+                _process_twig_files,
+                itertools.repeat(directory),
+                tasks.keys(),
+                tasks.values(),
+                chunksize=chunksize,
+            )
+            write_messages(
+                cache_results(
+                    itertools.chain.from_iterable(results), fingerprints, new_cache
+                )
+            )
 
-This is the {component_name.replace('-', ' ')} component.
+    # Processing a directory leaves the README.md of its last processed
+    # component, so it is rewritten where the last component was skipped
+    for root, file in last_components.items():
+        if root not in tasks or tasks[root][-1][0] != file:
+            write_readme(root, file.partition(".")[0])
 
-## Usage
+    # The cache is only written after a complete run. Entries of Twig files
+    # that no longer exist are dropped.
+    if cache_path:
+        write_if_changed(
+            cache_path,
+            json.dumps({"version": cache_version, "files": new_cache}, indent=1),
+        )
 
-This component can be used within Experience Builder and other page builders
-that support SDC. It can also be added to other components and theme templates.
-"""
-                # Open a file in write mode and write the content to it
-                readme_file_path = os.path.join(root, "README.md")
-                with open(readme_file_path, "w") as file:
-                    file.write(readme_content)
-                # Print relative path of processed files
-                relative_file_path = os.path.relpath(file_path, directory)
-                relative_yaml_path = os.path.relpath(yaml_file_path, directory)
-                print(
-                    f"Processed {relative_file_path}, output saved to {relative_yaml_path}"
-                )
+
+def cache_results(results, fingerprints, new_cache):
+    """
+    Record the processed components in the cache and yield their messages.
+
+    Args:
+      results (iterable): The results of process_twig_files().
+      fingerprints (dict): The fingerprints of the Twig files to cache, keyed by path.
+      new_cache (dict): The cache entries to add the processed components to.
+
+    Yields:
+      str: The message reporting each processed component.
+    """
+    for file_path, message, dependencies in results:
+        if file_path in fingerprints:
+            includes = {}
+            for file_name, include_file_path in dependencies.items():
+                include_fingerprint = None
+                if include_file_path:
+                    include_fingerprint = file_fingerprint(include_file_path)
+                    if include_fingerprint is None:
+                        # The include file was removed after it was parsed,
+                        # leave the component to be processed again
+                        break
+                    include_fingerprint = [include_file_path] + include_fingerprint
+                includes[file_name] = include_fingerprint
+            else:
+                new_cache[file_path] = {
+                    "twig": fingerprints[file_path],
+                    "includes": includes,
+                }
+        yield message
+
+
+def write_messages(messages, batch_size=64):
+    """
+    Write progress messages to stdout in batches.
+
+    Batching trades one write call per processed file for one per batch.
+    Pending messages are still written if processing fails part way.
+
+    Args:
+      messages (iterable): The messages to write, one per line.
+      batch_size (int): The number of messages to write at once.
+    """
+    lines = []
+    try:
+        for message in messages:
+            lines.append(message + "\n")
+            if len(lines) >= batch_size:
+                sys.stdout.write("".join(lines))
+                lines.clear()
+    finally:
+        sys.stdout.write("".join(lines))
+
+
+def positive_int(value):
+    """Parse a command line value that must be an integer greater than zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
 
 
 def main():
@@ -554,7 +1312,22 @@ def main():
     parser.add_argument(
         "directory", help="Path to the directory containing Twig files."
     )
-    
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs). "
+        "Use 1 to process the files sequentially.",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="FILE",
+        default=None,
+        help="Cache file used to skip components that are unchanged since "
+        "the previous run with the same cache file.",
+    )
+
     args = parser.parse_args()
     directory = args.directory
 
@@ -565,7 +1338,9 @@ def main():
     if components_index != -1:
         components_path = directory[:components_index + len('components')]
         
-    process_directory(args.directory, components_path)
+    process_directory(
+        args.directory, index_include_files(components_path), args.jobs, args.cache
+    )
 
 if __name__ == "__main__":
     main()